@@ -1,339 +1,351 @@
 import streamlit as st
 import streamlit.components.v1 as components
-import json
-import base64
-import csv
-import re
 from pathlib import Path
+import numpy as np
 import pandas as pd
-from streamlit_agraph import agraph, Node, Edge, Config
+from streamlit_agraph import agraph, Config
+
+from atlas.browser import open_in_new_tab_script
+from atlas.graph import GraphItem
+from atlas.images import read_robot_image_cache
+from atlas.parsing import parse_datasets, parser_fingerprint
 
 st.set_page_config(page_title="RoboData Atlas", layout="wide")
 
 # --- 1. Load Data ---
 BASE_DIR = Path(__file__).parent
 DATASET_PATH = BASE_DIR / "data/Open-X-Embodiment-Dataset.tsv"
-_SLUG_PATTERN = re.compile(r"[^a-z0-9]+")
-
-
-def _slugify(value: str) -> str:
-    cleaned = value.strip().lower()
-    cleaned = _SLUG_PATTERN.sub("-", cleaned).strip("-")
-    return cleaned or "dataset"
-
-
-def _parse_int(value) -> int:
-    if value is None:
-        return 0
-    text = str(value).strip()
-    if not text:
-        return 0
-    text = text.replace(",", "")
-    try:
-        return int(float(text))
-    except ValueError:
-        return 0
-
-
-@st.cache_data
-def load_data():
-    datasets = []
-    if not DATASET_PATH.exists():
-        return datasets
-
-    with DATASET_PATH.open("r", encoding="utf-8", newline="") as f:
-        reader = csv.reader(f, delimiter="\t")
-        header = next(reader, None)
-        if not header:
-            return datasets
-        num_columns = len(header)
-
-        for row in reader:
-            if not any(cell.strip() for cell in row):
-                continue
-
-            version = None
-            if len(row) == num_columns + 1 and row[0].strip().lower().startswith("v"):
-                version = row[0].strip()
-                row = row[1:]
-
-            if len(row) > num_columns:
-                overflow = row[num_columns:]
-                row = row[:num_columns]
-                if overflow:
-                    combined = " ".join(part for part in [row[-1], *overflow] if part.strip())
-                    row[-1] = combined.strip()
-            elif len(row) < num_columns:
-                row = row + [""] * (num_columns - len(row))
-
-            record = dict(zip(header, row))
-            if version:
-                record["Version"] = version
-
-            dataset_name = record.get("Dataset", "").strip()
-            if not dataset_name:
-                continue
-
-            dataset_id = record.get("Registered Dataset Name", "").strip()
-            if not dataset_id:
-                dataset_id = _slugify(dataset_name)
-
-            dataset_url = record.get("Dataset URL", "").strip()
-            if not dataset_url:
-                dataset_url = None
-
-            rgb_cams = _parse_int(record.get("# RGB Cams"))
-            depth_cams = _parse_int(record.get("# Depth Cams"))
-            wrist_cams = _parse_int(record.get("# Wrist Cams"))
-
-            sensors = []
-            if rgb_cams > 0:
-                sensors.append("RGB")
-            if depth_cams > 0:
-                sensors.append("Depth")
-            if record.get("Has Proprioception?", "").strip().lower() == "yes":
-                sensors.append("Proprioception")
-            language_annotation = record.get("Language Annotations", "").strip()
-            if language_annotation and language_annotation.lower() not in {"none", "no"}:
-                sensors.append("Language")
-            sensors = list(dict.fromkeys(sensors))
-
-            viewpoints = []
-            if wrist_cams > 0:
-                viewpoints.append("Wrist")
-            if rgb_cams > 0 or depth_cams > 0:
-                viewpoints.append("External")
-            viewpoints = list(dict.fromkeys(viewpoints))
-
-            frequency_raw = record.get("Control Frequency", "").strip()
-            if frequency_raw and not frequency_raw.lower().endswith("hz"):
-                frequency = f"{frequency_raw} Hz"
-            elif frequency_raw:
-                frequency = frequency_raw
-            else:
-                frequency = "Unknown"
-
-            datasets.append(
-                {
-                    "id": dataset_id,
-                    "name": dataset_name,
-                    "description": record.get("Description", "").strip(),
-                    "url": dataset_url,
-                    "hardware": {
-                        "robot": record.get("Robot", "Unknown").strip() or "Unknown",
-                        "end_effector": record.get("Gripper", "Unknown").strip() or "Unknown",
-                        "morphology": record.get("Robot Morphology", "").strip(),
-                    },
-                    "modality": {
-                        "sensors": sensors,
-                        "viewpoints": viewpoints,
-                    },
-                    "task_env": {
-                        "environment": record.get("Scene Type", "Unknown").strip() or "Unknown",
-                        "domain": record.get("Data Collect Method", "").strip(),
-                        "language_labels": language_annotation.lower() not in {"", "none", "no"},
-                    },
-                    "engineering": {
-                        "format": record.get("Action Space", "Unknown").strip() or "Unknown",
-                        "frequency": frequency,
-                    },
-                    "stats": {
-                        "episodes": record.get("# Episodes", "").strip(),
-                        "file_size_gb": record.get("File Size (GB)", "").strip(),
-                        "language_annotations": language_annotation,
-                        "data_collect_method": record.get("Data Collect Method", "").strip(),
-                        "has_suboptimal": record.get("Has Suboptimal?", "").strip(),
-                        "has_camera_calibration": record.get("Has Camera Calibration?", "").strip(),
-                        "has_proprioception": record.get("Has Proprioception?", "").strip(),
-                    },
-                    "registered_name": record.get("Registered Dataset Name", "").strip(),
-                    "citation": record.get("Citation", "").strip(),
-                    "latex_reference": record.get("Latex Reference", "").strip(),
-                    "version": record.get("Version"),
-                }
-            )
 
-    return datasets
-
-ROBOT_IMAGE_FILES = {
-    "Cobotta": "assets/images/cobotta.png",
-    "DLR EDAN": "assets/images/dlr-edan.jpeg",
-    "DLR SARA": "assets/images/dlr-sara.jpeg",
-    "Fanuc Mate": "assets/images/fanuc-mate.png",
-    "Franka": "assets/images/Franka-Emika-Panda.png",
-    "Google Robot": "assets/images/google-robot.png",
-    "Hello Stretch": "assets/images/hello-stretch.png",
-    "Jackal": "assets/images/jackal.jpg",
-    "Jaco 2": "assets/images/jaco-2.webp",
-    "Kinova Gen3": "assets/images/kinova-gen3.webp",
-    "Kuka iiwa": "assets/images/kuka-iiwa.png",
-    "MobileALOHA": "assets/images/mobile-aloha.avif",
-    # "Multi-Robot": "",
-    "PAMY2": "assets/images/pamy2.png",
-    "PR2": "assets/images/pr2.jpg",
-    "RC Car": "assets/images/rc-car.webp",
-    "Sawyer": "assets/images/sawyer.jpg",
-    "Spot": "assets/images/spot.jpg",
-    "TidyBot": "assets/images/tidybot.png",
-    "TurtleBot 2": "assets/images/turtlebot-2.png",
-    "UR5": "assets/images/ur5.png",
-    "Unitree A1": "assets/images/unitree-a1.png",
-    "ViperX Bimanual": "assets/images/viperx-bimanual.png",
-    "WidowX": "assets/images/WidowX-250.png",
-    "xArm": "assets/images/xarm.avif",
-    "xArm Bimanual": "assets/images/xarm-bimanual.png",
-    ### Unused images
-    # "Fetch Mobile Manipulator": "assets/images/Fetch-Mobile-Manipulator.png",
-}
+
+@st.cache_data(persist="disk", show_spinner=False)
+def load_data(data_version):
+    return parse_datasets(DATASET_PATH)
+
+
+def get_data_version():
+    # load_data() persists across restarts, so everything derived from it is
+    # keyed on the parser source and the TSV's modification time to pick up
+    # code changes and edits.
+    mtime = DATASET_PATH.stat().st_mtime_ns if DATASET_PATH.exists() else None
+    return parser_fingerprint(), mtime
 
 
 @st.cache_resource(show_spinner=False)
 def load_robot_images():
-    images = {}
-    for robot_name, relative_path in ROBOT_IMAGE_FILES.items():
-        abs_path = (BASE_DIR / relative_path).resolve()
-        if abs_path.exists():
-            suffix = abs_path.suffix.lower()
-            if suffix in {".jpg", ".jpeg"}:
-                mime = "image/jpeg"
-            elif suffix == ".gif":
-                mime = "image/gif"
-            elif suffix == ".webp":
-                mime = "image/webp"
-            elif suffix == ".avif":
-                mime = "image/avif"
-            else:
-                mime = "image/png"
-            encoded = base64.b64encode(abs_path.read_bytes()).decode("utf-8")
-            images[robot_name] = f"data:{mime};base64,{encoded}"
-    return images
+    return read_robot_image_cache()
 
 
-robot_images = load_robot_images()
+@st.cache_data(show_spinner=False)
+def get_filter_options(data_version):
+    datasets = load_data(data_version)
+    all_robots = tuple(sorted({d.robot for d in datasets}, key=str.lower))
+    all_envs = tuple(sorted({d.environment for d in datasets}, key=str.lower))
+    return all_robots, all_envs
 
 
-data = load_data()
-if "last_clicked_node" not in st.session_state:
-    st.session_state["last_clicked_node"] = None
+@st.cache_resource(show_spinner=False)
+def get_index(data_version):
+    # Like the Atlas nodes, the first dataset wins when ids are duplicated.
+    index = {}
+    for d in load_data(data_version):
+        index.setdefault(d.id, d)
+    return index
 
 
-# --- 2. Sidebar Filters ---
-st.sidebar.title("RoboData Atlas")
-page = st.sidebar.radio("Navigate", ("Atlas", "All datasets"), index=0)
-st.sidebar.divider()
-st.sidebar.header("🔍 Filter Atlas")
+@st.cache_resource(show_spinner=False)
+def get_filter_columns(data_version):
+    datasets = load_data(data_version)
+    robot_column = np.array([d.robot for d in datasets])
+    env_column = np.array([d.environment for d in datasets])
+    return robot_column, env_column
 
-# Extract unique options for filters
-all_robots = sorted({d['hardware']['robot'] for d in data})
-all_envs = sorted({d['task_env']['environment'] for d in data})
 
-selected_robots = st.sidebar.multiselect("Select Robot Hardware", all_robots, default=all_robots)
-selected_envs = st.sidebar.multiselect("Select Scene Type", all_envs, default=all_envs)
+def filter_indices(data_version, selected_robots, selected_envs):
+    robot_column, env_column = get_filter_columns(data_version)
+    mask = np.isin(robot_column, selected_robots) & np.isin(env_column, selected_envs)
+    return np.flatnonzero(mask)
 
-# Filter the dataset list based on selection
-filtered_data = [
-    d for d in data
-    if d['hardware']['robot'] in selected_robots
-    and d['task_env']['environment'] in selected_envs
-]
 
-st.sidebar.markdown(f"**Showing {len(filtered_data)} datasets**")
+def _group_id(d):
+    return f"group_{d.robot}|{d.environment}|{d.format}"
 
-if page == "Atlas":
-    nodes = []
-    edges = []
-    existing_nodes = set()
-
-    def add_node(id, label, color=None, shape="dot", size=25, title=None, **node_kwargs):
-        if id not in existing_nodes:
-            node_title = title if title is not None else (label if label not in (None, "") else id)
-            nodes.append(
-                Node(
-                    id=id,
-                    label=label,
-                    title=node_title,
-                    color=color,
-                    shape=shape,
-                    size=size,
-                    **node_kwargs,
-                )
-            )
-            existing_nodes.add(id)
 
-    for d in filtered_data:
-        dataset_node_id = d['id']
-        robot_name = d['hardware']['robot']
-        scene_type = d['task_env']['environment']
-        action_space = d['engineering']['format']
-        stats = d.get("stats", {})
-        episodes = stats.get("episodes")
+# Datasets sharing robot, scene and action space collapse into one Atlas node.
+# The sidebar filters always keep or drop such a group as a whole.
+@st.cache_resource(show_spinner=False)
+def get_dataset_groups(data_version):
+    groups = {}
+    for d in load_data(data_version):
+        groups.setdefault(_group_id(d), []).append(d)
+    return {group_id: members for group_id, members in groups.items() if len(members) > 1}
+
+
+def _attribute_edges(node_id, robot_name, scene_type, action_space):
+    return (
+        GraphItem({
+            "from": f"robot_{robot_name}",
+            "to": node_id,
+            "color": "#FFBB28",
+            "title": f"Robot: {robot_name}",
+            "arrows": "to",
+        }),
+        GraphItem({
+            "from": node_id,
+            "to": f"scene_{scene_type}",
+            "color": "#FF8042",
+            "title": f"Scene: {scene_type}",
+            "arrows": "to",
+        }),
+        GraphItem({
+            "from": node_id,
+            "to": f"action_{action_space}",
+            "color": "#8884d8",
+            "title": f"Action space: {action_space}",
+            "arrows": "to",
+        }),
+    )
+
+
+# Nodes and edges depend only on each dataset, not on the filters, so they are
+# built once per data version. Per-dataset entries line up with load_data().
+@st.cache_resource(show_spinner=False)
+def build_all_graph_objects(data_version):
+    robot_images = load_robot_images()
+    groups = get_dataset_groups(data_version)
+
+    dataset_graph_objects = []
+    attribute_nodes = {}
+    group_graph_objects = {}
+    for d in load_data(data_version):
+        dataset_node_id = d.id
+        robot_name = d.robot
+        scene_type = d.environment
+        action_space = d.format
+        robot_id = f"robot_{robot_name}"
+        scene_id = f"scene_{scene_type}"
+        action_id = f"action_{action_space}"
+
+        if robot_id not in attribute_nodes:
+            robot_image = robot_images.get(robot_name)
+            if robot_image:
+                attribute_nodes[robot_id] = GraphItem({
+                    "id": robot_id,
+                    "label": robot_name,
+                    "title": f"Robot: {robot_name}",
+                    "color": {"border": "#FFBB28", "background": "#ffffff"},
+                    "shape": "circularImage",
+                    "size": 36,
+                    "image": robot_image,
+                })
+            else:
+                attribute_nodes[robot_id] = GraphItem({
+                    "id": robot_id,
+                    "label": robot_name,
+                    "title": f"Robot: {robot_name}",
+                    "color": "#FFBB28",
+                    "shape": "dot",
+                    "size": 18,
+                })
+        if scene_id not in attribute_nodes:
+            attribute_nodes[scene_id] = GraphItem({
+                "id": scene_id,
+                "label": "",
+                "title": f"Scene: {scene_type}",
+                "color": "#FF8042",
+                "shape": "dot",
+                "size": 10,
+            })
+        if action_id not in attribute_nodes:
+            attribute_nodes[action_id] = GraphItem({
+                "id": action_id,
+                "label": "",
+                "title": f"Action space: {action_space}",
+                "color": "#8884d8",
+                "shape": "dot",
+                "size": 10,
+            })
 
         dataset_title_lines = [
-            d['name'],
+            d.name,
             f"Robot: {robot_name}",
             f"Scene: {scene_type}",
             f"Action space: {action_space}",
         ]
-        if episodes:
-            dataset_title_lines.append(f"Episodes: {episodes}")
-        if d.get("version"):
-            dataset_title_lines.append(f"Version: {d['version']}")
-        dataset_title = "\n".join(dataset_title_lines)
-        add_node(dataset_node_id, d['name'], "#00C49F", size=12, title=dataset_title, image="")
+        if d.episodes:
+            dataset_title_lines.append(f"Episodes: {d.episodes}")
+        if d.version:
+            dataset_title_lines.append(f"Version: {d.version}")
+        dataset_node = GraphItem({
+            "id": dataset_node_id,
+            "label": d.name,
+            "title": "\n".join(dataset_title_lines),
+            "color": "#00C49F",
+            "shape": "dot",
+            "size": 12,
+            "image": "",
+        })
+        dataset_edges = _attribute_edges(dataset_node_id, robot_name, scene_type, action_space)
+
+        group_id = _group_id(d)
+        if group_id not in groups:
+            group_id = None
+        elif group_id not in group_graph_objects:
+            members = groups[group_id]
+            group_title_lines = [
+                f"{len(members)} datasets",
+                f"Robot: {robot_name}",
+                f"Scene: {scene_type}",
+                f"Action space: {action_space}",
+                *(member.name for member in members),
+            ]
+            group_node = GraphItem({
+                "id": group_id,
+                "label": f"{len(members)} datasets",
+                "title": "\n".join(group_title_lines),
+                "color": "#00C49F",
+                "shape": "dot",
+                "size": 12 + 2 * len(members),
+            })
+            group_edges = _attribute_edges(group_id, robot_name, scene_type, action_space)
+            group_graph_objects[group_id] = (group_node, group_edges)
+
+        dataset_graph_objects.append(
+            (dataset_node, (robot_id, scene_id, action_id), dataset_edges, group_id)
+        )
 
-        robot_id = f"robot_{robot_name}"
-        robot_image = robot_images.get(robot_name)
-        if robot_image:
-            add_node(
-                robot_id,
-                robot_name,
-                color={"border": "#FFBB28", "background": "#ffffff"},
-                shape="circularImage",
-                size=36,
-                title=f"Robot: {robot_name}",
-                image=robot_image,
-            )
+    return dataset_graph_objects, attribute_nodes, group_graph_objects
+
+
+def _hub_edges(dataset_graph_objects, attribute_nodes, indices):
+    # Collapse each robot -> dataset -> attribute path into a direct
+    # robot -> attribute link, weighted by the number of datasets behind it.
+    counts = {}
+    for i in indices:
+        _, (robot_id, scene_id, action_id), _, _ = dataset_graph_objects[i]
+        for attribute_id in (scene_id, action_id):
+            key = (robot_id, attribute_id)
+            counts[key] = counts.get(key, 0) + 1
+
+    return [
+        GraphItem({
+            "from": robot_id,
+            "to": attribute_id,
+            "color": attribute_nodes[attribute_id]["color"],
+            "title": f"{attribute_nodes[attribute_id]['title']} ({count} dataset{'' if count == 1 else 's'})",
+            "value": count,
+            "arrows": "to",
+        })
+        for (robot_id, attribute_id), count in counts.items()
+    ]
+
+
+# Keyed on the sorted selections; cache_resource hands back the same lists
+# instead of unpickling the embedded robot images on every rerun.
+@st.cache_resource(show_spinner=False, max_entries=32)
+def build_graph(data_version, selected_robots, selected_envs, show_datasets=True, group_datasets=True):
+    dataset_graph_objects, attribute_nodes, group_graph_objects = build_all_graph_objects(data_version)
+    indices = filter_indices(data_version, selected_robots, selected_envs)
+
+    dataset_nodes = {}
+    attribute_ids = {}
+    group_ids = {}
+    edges = []
+    for i in indices:
+        dataset_node, dataset_attribute_ids, dataset_edges, group_id = dataset_graph_objects[i]
+        attribute_ids.update(dict.fromkeys(dataset_attribute_ids))
+        if not show_datasets:
+            continue
+        if group_datasets and group_id:
+            group_ids[group_id] = None
         else:
-            add_node(
-                robot_id,
-                robot_name,
-                "#FFBB28",
-                size=18,
-                title=f"Robot: {robot_name}",
-            )
-        edges.append(
-            Edge(
-                source=robot_id,
-                target=dataset_node_id,
-                color="#FFBB28",
-                title=f"Robot: {robot_name}",
-                arrows="to",
-            )
+            # Duplicate node ids break the vis.js render; keep the first dataset.
+            dataset_nodes.setdefault(dataset_node["id"], dataset_node)
+            edges.extend(dataset_edges)
+
+    nodes = [attribute_nodes[attribute_id] for attribute_id in attribute_ids]
+    if not show_datasets:
+        return nodes, _hub_edges(dataset_graph_objects, attribute_nodes, indices)
+    for group_id in group_ids:
+        group_node, group_edges = group_graph_objects[group_id]
+        nodes.append(group_node)
+        edges.extend(group_edges)
+    nodes.extend(dataset_nodes.values())
+    return nodes, edges
+
+
+@st.cache_data(show_spinner=False)
+def get_full_table(data_version):
+    table_rows = []
+    for d in load_data(data_version):
+        table_rows.append(
+            {
+                "ID": d.id,
+                "Dataset": d.name,
+                "Dataset URL": d.url or "",
+                "Robot": d.robot,
+                "Morphology": d.morphology or "Unspecified",
+                "Scene Type": d.environment,
+                "Action Space": d.format,
+                "Control Frequency": d.frequency,
+                "Data Collect Method": d.data_collect_method or "Unspecified",
+                "Episodes": d.episodes or "Unspecified",
+                "File Size (GB)": d.file_size_gb or "Unspecified",
+                "Language Annotations": d.language_annotations or "None",
+                "Sensors": ", ".join(d.sensors) or "Unspecified",
+                "Views": ", ".join(d.viewpoints) or "Unspecified",
+                "Version": d.version or "",
+                "Registered Name": d.registered_name or "",
+            }
         )
 
-        scene_id = f"scene_{scene_type}"
-        add_node(scene_id, "", "#FF8042", size=10, title=f"Scene: {scene_type}")
-        edges.append(
-            Edge(
-                source=dataset_node_id,
-                target=scene_id,
-                color="#FF8042",
-                title=f"Scene: {scene_type}",
-                arrows="to",
-            )
-        )
+    df = pd.DataFrame(table_rows)
+    if not df.empty:
+        df.rename(columns={"Dataset URL": "Dataset Link"}, inplace=True)
+        df["Dataset Link"] = df["Dataset Link"].apply(lambda url: url or None)
+    return df
 
-        action_id = f"action_{action_space}"
-        add_node(action_id, "", "#8884d8", size=10, title=f"Action space: {action_space}")
-        edges.append(
-            Edge(
-                source=dataset_node_id,
-                target=action_id,
-                color="#8884d8",
-                title=f"Action space: {action_space}",
-                arrows="to",
-            )
-        )
+
+data_version = get_data_version()
+if "last_clicked_node" not in st.session_state:
+    st.session_state["last_clicked_node"] = None
+
+
+# --- 2. Sidebar Filters ---
+st.sidebar.title("RoboData Atlas")
+page = st.sidebar.radio("Navigate", ("Atlas", "All datasets"), index=0)
+st.sidebar.divider()
+st.sidebar.header("🔍 Filter Atlas")
+
+# Extract unique options for filters
+all_robots, all_envs = get_filter_options(data_version)
+
+selected_robots = st.sidebar.multiselect("Select Robot Hardware", all_robots, default=all_robots)
+selected_envs = st.sidebar.multiselect("Select Scene Type", all_envs, default=all_envs)
+
+# Count the datasets matching the selection
+num_filtered = len(filter_indices(data_version, selected_robots, selected_envs))
+
+st.sidebar.markdown(f"**Showing {num_filtered} datasets**")
+
+if page == "Atlas":
+    show_datasets = st.sidebar.checkbox(
+        "Show dataset nodes",
+        value=True,
+        help="Untick for an overview of robot, scene and action space hubs only.",
+    )
+    group_datasets = st.sidebar.checkbox(
+        "Group similar datasets",
+        value=True,
+        help="Merge datasets that share robot, scene type and action space into one node.",
+        disabled=not show_datasets,
+    )
+    nodes, edges = build_graph(
+        data_version,
+        tuple(sorted(selected_robots)),
+        tuple(sorted(selected_envs)),
+        show_datasets,
+        group_datasets,
+    )
 
     st.title("RoboData Atlas 🗺️")
 
@@ -370,7 +382,10 @@ if page == "Atlas":
     st.markdown(legend_html, unsafe_allow_html=True)
 
     st.markdown("Interactive map of robotics datasets. **Drag nodes** to explore connections.")
-    st.caption("Tip: Click a dataset node to open its dataset page in a new tab.")
+    st.caption(
+        "Tip: Click a dataset node to open its dataset page in a new tab, "
+        "or a grouped node to list the datasets it contains."
+    )
 
     config = Config(
         width="100%",
@@ -381,8 +396,16 @@ if page == "Atlas":
         nodeHighlightBehavior=True,
         highlightColor="#F7A7A6",
         collapsible=False,
-        fit=False,
     )
+    # Config only takes a boolean for physics, but its attributes are passed
+    # straight through as vis-network options: settle the layout once on load
+    # instead of running the force simulation continuously. Update rather than
+    # replace the dict to keep Config's velocity and timestep defaults.
+    config.physics.update(
+        solver="forceAtlas2Based",
+        stabilization={"enabled": True, "iterations": 200, "fit": True},
+    )
+    config.configure = {"enabled": False}
 
     return_value = agraph(nodes=nodes, edges=edges, config=config)
 
@@ -391,69 +414,72 @@ if page == "Atlas":
         is_new_click = clicked_node_id != st.session_state.get("last_clicked_node")
         st.session_state["last_clicked_node"] = clicked_node_id
 
-        dataset_info = next((item for item in data if item["id"] == clicked_node_id), None)
+        dataset_info = get_index(data_version).get(clicked_node_id)
+        group_members = get_dataset_groups(data_version).get(clicked_node_id)
 
-        if dataset_info:
-            dataset_url = dataset_info.get("url")
+        if group_members:
+            first_member = group_members[0]
+            st.divider()
+            st.subheader(f"📂 {len(group_members)} datasets")
+            st.markdown(
+                f"**🤖 Robot:** {first_member.robot} • "
+                f"**🗺️ Scene Type:** {first_member.environment} • "
+                f"**⚙️ Action Space:** {first_member.format}"
+            )
+            for member in group_members:
+                member_line = f"[{member.name}]({member.url})" if member.url else member.name
+                if member.episodes:
+                    member_line += f" — {member.episodes} episodes"
+                st.markdown(f"- {member_line}")
+        elif dataset_info:
+            dataset_url = dataset_info.url
             if dataset_url and is_new_click:
-                components.html(
-                    f"<script>window.open({json.dumps(dataset_url)}, '_blank');</script>",
-                    height=0,
-                    width=0,
-                )
+                components.html(open_in_new_tab_script(dataset_url), height=0, width=0)
 
             st.divider()
-            st.subheader(f"📂 {dataset_info['name']}")
+            st.subheader(f"📂 {dataset_info.name}")
 
             meta_badges = []
-            if dataset_info.get("version"):
-                meta_badges.append(f"**Version:** {dataset_info['version']}")
-            if dataset_info.get("registered_name"):
-                meta_badges.append(f"**Registered name:** {dataset_info['registered_name']}")
+            if dataset_info.version:
+                meta_badges.append(f"**Version:** {dataset_info.version}")
+            if dataset_info.registered_name:
+                meta_badges.append(f"**Registered name:** {dataset_info.registered_name}")
             if meta_badges:
                 st.markdown(" • ".join(meta_badges))
 
-            description_text = dataset_info.get("description") or "No description provided."
+            description_text = dataset_info.description or "No description provided."
             st.write(description_text)
 
-            hardware = dataset_info.get("hardware", {})
-            modality = dataset_info.get("modality", {})
-            task_env = dataset_info.get("task_env", {})
-            engineering = dataset_info.get("engineering", {})
-            stats = dataset_info.get("stats", {})
-
-            sensors_list = modality.get("sensors") or []
-            views_list = modality.get("viewpoints") or []
-            sensors_text = ", ".join(sensors_list) if sensors_list else "Unspecified"
-            views_text = ", ".join(views_list) if views_list else "Unspecified"
-            scene_text = task_env.get("environment", "Unknown")
-            language_text = stats.get("language_annotations") or "None"
-            data_collect_text = stats.get("data_collect_method") or "Unspecified"
-            episodes_text = stats.get("episodes") or "Unspecified"
-            file_size_text = stats.get("file_size_gb") or "Unspecified"
+            sensors_text = ", ".join(dataset_info.sensors) or "Unspecified"
+            views_text = ", ".join(dataset_info.viewpoints) or "Unspecified"
+            scene_text = dataset_info.environment
+            language_text = dataset_info.language_annotations or "None"
+            data_collect_text = dataset_info.data_collect_method or "Unspecified"
+            episodes_text = dataset_info.episodes or "Unspecified"
+            file_size_text = dataset_info.file_size_gb or "Unspecified"
 
             col1, col2, col3 = st.columns(3)
             with col1:
-                st.markdown(f"**🤖 Robot:** {hardware.get('robot', 'Unknown')}")
-                st.markdown(f"**🛠️ Morphology:** {hardware.get('morphology') or 'Unspecified'}")
-                st.markdown(f"**🖐️ Gripper:** {hardware.get('end_effector', 'Unknown')}")
+                st.markdown(f"**🤖 Robot:** {dataset_info.robot}")
+                st.markdown(f"**🛠️ Morphology:** {dataset_info.morphology or 'Unspecified'}")
+                st.markdown(f"**🖐️ Gripper:** {dataset_info.end_effector}")
             with col2:
                 st.markdown(f"**👁️ Sensors:** {sensors_text}")
                 st.markdown(f"**📷 Views:** {views_text}")
                 st.markdown(f"**🗺️ Scene Type:** {scene_text}")
                 st.markdown(f"**🗣️ Language Annotations:** {language_text}")
             with col3:
-                st.markdown(f"**⚙️ Action Space:** {engineering.get('format', 'Unknown')}")
-                st.markdown(f"**⏱️ Control Freq:** {engineering.get('frequency', 'Unknown')}")
+                st.markdown(f"**⚙️ Action Space:** {dataset_info.format}")
+                st.markdown(f"**⏱️ Control Freq:** {dataset_info.frequency}")
                 st.markdown(f"**🧠 Data Collection:** {data_collect_text}")
                 st.markdown(f"**📦 Episodes:** {episodes_text}")
                 st.markdown(f"**💾 File Size (GB):** {file_size_text}")
 
             quality_flags = " | ".join(
                 [
-                    f"Suboptimal data: {stats.get('has_suboptimal') or 'Unknown'}",
-                    f"Camera calibration: {stats.get('has_camera_calibration') or 'Unknown'}",
-                    f"Proprioception: {stats.get('has_proprioception') or 'Unknown'}",
+                    f"Suboptimal data: {dataset_info.has_suboptimal or 'Unknown'}",
+                    f"Camera calibration: {dataset_info.has_camera_calibration or 'Unknown'}",
+                    f"Proprioception: {dataset_info.has_proprioception or 'Unknown'}",
                 ]
             )
             st.markdown(f"**Quality flags:** {quality_flags}")
@@ -461,52 +487,21 @@ if page == "Atlas":
             if dataset_url:
                 st.markdown(f"[🔗 Go to Dataset Website]({dataset_url})")
 
-            if dataset_info.get("citation"):
+            if dataset_info.citation:
                 with st.expander("📚 Citation"):
-                    st.markdown(dataset_info["citation"])
+                    st.markdown(dataset_info.citation)
 
-            if dataset_info.get("latex_reference"):
-                st.markdown(f"**LaTeX reference:** `{dataset_info['latex_reference']}`")
+            if dataset_info.latex_reference:
+                st.markdown(f"**LaTeX reference:** `{dataset_info.latex_reference}`")
 else:
     st.title("All datasets")
     st.markdown("Browse the filtered datasets in a tabular view.")
 
-    table_rows = []
-    for d in filtered_data:
-        hardware = d.get("hardware", {})
-        modality = d.get("modality", {})
-        stats = d.get("stats", {})
-        task_env = d.get("task_env", {})
-        engineering = d.get("engineering", {})
-        sensors_text = ", ".join(modality.get("sensors") or []) or "Unspecified"
-        views_text = ", ".join(modality.get("viewpoints") or []) or "Unspecified"
-
-        table_rows.append(
-            {
-                "ID": d["id"],
-                "Dataset": d["name"],
-                "Dataset URL": d.get("url") or "",
-                "Robot": hardware.get("robot", "Unknown"),
-                "Morphology": hardware.get("morphology") or "Unspecified",
-                "Scene Type": task_env.get("environment", "Unknown"),
-                "Action Space": engineering.get("format", "Unknown"),
-                "Control Frequency": engineering.get("frequency", "Unknown"),
-                "Data Collect Method": stats.get("data_collect_method") or "Unspecified",
-                "Episodes": stats.get("episodes") or "Unspecified",
-                "File Size (GB)": stats.get("file_size_gb") or "Unspecified",
-                "Language Annotations": stats.get("language_annotations") or "None",
-                "Sensors": sensors_text,
-                "Views": views_text,
-                "Version": d.get("version") or "",
-                "Registered Name": d.get("registered_name") or "",
-            }
-        )
-
-    df = pd.DataFrame(table_rows)
+    df = get_full_table(data_version)
     column_config = {}
     if not df.empty:
-        df.rename(columns={"Dataset URL": "Dataset Link"}, inplace=True)
-        df["Dataset Link"] = df["Dataset Link"].apply(lambda url: url or None)
+        df = df[df["Robot"].isin(selected_robots) & df["Scene Type"].isin(selected_envs)]
+        df = df.reset_index(drop=True)
         column_config["Dataset Link"] = st.column_config.LinkColumn(
             "Dataset Link",
             help="Open dataset website in a new tab",
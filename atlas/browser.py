@@ -0,0 +1,16 @@
+import functools
+
+try:
+    import orjson
+
+    def _json_dumps(value):
+        return orjson.dumps(value).decode("utf-8")
+
+except ImportError:
+    from json import dumps as _json_dumps
+
+
+# Lives outside app.py so the cache survives Streamlit re-executing the script.
+@functools.lru_cache(maxsize=256)
+def open_in_new_tab_script(url):
+    return f"<script>window.open({_json_dumps(url)}, '_blank');</script>"
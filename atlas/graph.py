@@ -0,0 +1,13 @@
+class GraphItem(dict):
+    # A pre-serialized vis.js node or edge. agraph() only reads `.id` and calls
+    # `.to_dict()` on what it is given, so a plain dict that answers both can
+    # stand in for streamlit_agraph's Node and Edge objects.
+
+    def __getattr__(self, name):
+        try:
+            return self[name]
+        except KeyError:
+            raise AttributeError(name) from None
+
+    def to_dict(self):
+        return self
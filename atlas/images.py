@@ -0,0 +1,132 @@
+import hashlib
+import io
+import json
+import warnings
+from pathlib import Path
+
+try:
+    import pybase64 as base64
+except ImportError:
+    import base64
+
+try:
+    from orjson import loads as json_loads
+except ImportError:
+    from json import loads as json_loads
+
+BASE_DIR = Path(__file__).resolve().parent.parent
+ROBOT_IMAGE_CACHE_PATH = BASE_DIR / "assets/images/robot_images.json"
+
+# A multiple of 3, so encoded chunks concatenate without padding in between.
+_ENCODE_CHUNK_SIZE = 48 * 1024
+
+_MIME_BY_SUFFIX = {
+    ".jpg": "image/jpeg",
+    ".jpeg": "image/jpeg",
+    ".gif": "image/gif",
+    ".webp": "image/webp",
+    ".avif": "image/avif",
+    ".png": "image/png",
+}
+
+ROBOT_IMAGE_FILES = {
+    "Cobotta": "assets/images/cobotta.png",
+    "DLR EDAN": "assets/images/dlr-edan.jpeg",
+    "DLR SARA": "assets/images/dlr-sara.jpeg",
+    "Fanuc Mate": "assets/images/fanuc-mate.png",
+    "Franka": "assets/images/Franka-Emika-Panda.png",
+    "Google Robot": "assets/images/google-robot.png",
+    "Hello Stretch": "assets/images/hello-stretch.png",
+    "Jackal": "assets/images/jackal.jpg",
+    "Jaco 2": "assets/images/jaco-2.webp",
+    "Kinova Gen3": "assets/images/kinova-gen3.webp",
+    "Kuka iiwa": "assets/images/kuka-iiwa.png",
+    "MobileALOHA": "assets/images/mobile-aloha.avif",
+    # "Multi-Robot": "",
+    "PAMY2": "assets/images/pamy2.png",
+    "PR2": "assets/images/pr2.jpg",
+    "RC Car": "assets/images/rc-car.webp",
+    "Sawyer": "assets/images/sawyer.jpg",
+    "Spot": "assets/images/spot.jpg",
+    "TidyBot": "assets/images/tidybot.png",
+    "TurtleBot 2": "assets/images/turtlebot-2.png",
+    "UR5": "assets/images/ur5.png",
+    "Unitree A1": "assets/images/unitree-a1.png",
+    "ViperX Bimanual": "assets/images/viperx-bimanual.png",
+    "WidowX": "assets/images/WidowX-250.png",
+    "xArm": "assets/images/xarm.avif",
+    "xArm Bimanual": "assets/images/xarm-bimanual.png",
+    ### Unused images
+    # "Fetch Mobile Manipulator": "assets/images/Fetch-Mobile-Manipulator.png",
+}
+
+
+def _encode_file(path):
+    out = io.BytesIO()
+    with path.open("rb") as f:
+        while chunk := f.read(_ENCODE_CHUNK_SIZE):
+            out.write(base64.b64encode(chunk))
+    return out.getvalue().decode("ascii")
+
+
+def encode_robot_images(robot_names=None):
+    images = {}
+    for robot_name in ROBOT_IMAGE_FILES if robot_names is None else robot_names:
+        abs_path = (BASE_DIR / ROBOT_IMAGE_FILES[robot_name]).resolve()
+        if abs_path.exists():
+            mime = _MIME_BY_SUFFIX.get(abs_path.suffix.lower(), "image/png")
+            images[robot_name] = f"data:{mime};base64,{_encode_file(abs_path)}"
+    return images
+
+
+def _image_source(robot_name):
+    abs_path = (BASE_DIR / ROBOT_IMAGE_FILES[robot_name]).resolve()
+    if not abs_path.exists():
+        return None
+    # Size and content digest rather than mtime, which a fresh checkout resets.
+    digest = hashlib.sha256(abs_path.read_bytes()).hexdigest()
+    return [ROBOT_IMAGE_FILES[robot_name], abs_path.stat().st_size, digest]
+
+
+def _write_cache(sources, images):
+    tmp_path = ROBOT_IMAGE_CACHE_PATH.with_suffix(".json.tmp")
+    tmp_path.write_text(json.dumps({"sources": sources, "images": images}), encoding="utf-8")
+    tmp_path.replace(ROBOT_IMAGE_CACHE_PATH)
+
+
+def read_robot_image_cache():
+    # Precomputed by scripts/build_robot_image_cache.py. Robots whose image was
+    # added, moved or modified since the last build are re-encoded and written
+    # back, so only the first start after a change pays for the encoding.
+    cached_images = {}
+    cached_sources = {}
+    if ROBOT_IMAGE_CACHE_PATH.exists():
+        cache = json_loads(ROBOT_IMAGE_CACHE_PATH.read_bytes())
+        cached_images = cache.get("images", {})
+        cached_sources = cache.get("sources", {})
+
+    images = {}
+    sources = {}
+    stale = []
+    for robot_name in ROBOT_IMAGE_FILES:
+        source = _image_source(robot_name)
+        if source is None:
+            continue
+        sources[robot_name] = source
+        if robot_name in cached_images and cached_sources.get(robot_name) == source:
+            images[robot_name] = cached_images[robot_name]
+        else:
+            stale.append(robot_name)
+    if stale:
+        images.update(encode_robot_images(stale))
+        try:
+            _write_cache(sources, images)
+        except OSError as exc:
+            warnings.warn(f"Could not update {ROBOT_IMAGE_CACHE_PATH.name}: {exc}")
+    return images
+
+
+def write_robot_image_cache():
+    images = encode_robot_images()
+    _write_cache({robot_name: _image_source(robot_name) for robot_name in images}, images)
+    return images
@@ -0,0 +1,175 @@
+import csv
+import functools
+import hashlib
+import re
+import string
+from pathlib import Path
+
+import numpy as np
+import pandas as pd
+
+from atlas.records import Dataset
+
+_SLUG_PATTERN = re.compile(r"[^a-z0-9]+")
+_SLUG_TABLE = str.maketrans(
+    {chr(code): "-" for code in range(128) if chr(code) not in string.ascii_lowercase + string.digits}
+)
+
+
+def _slugify(value: str) -> str:
+    cleaned = value.strip().lower()
+    if cleaned.isascii():
+        cleaned = cleaned.translate(_SLUG_TABLE)
+        while "--" in cleaned:
+            cleaned = cleaned.replace("--", "-")
+        cleaned = cleaned.strip("-")
+    else:
+        cleaned = _SLUG_PATTERN.sub("-", cleaned).strip("-")
+    return cleaned or "dataset"
+
+
+def _column(table: pd.DataFrame, name: str) -> pd.Series:
+    if name in table.columns:
+        return table[name]
+    return pd.Series("", index=table.index, dtype=object)
+
+
+def _to_int_column(table: pd.DataFrame, name: str) -> pd.Series:
+    values = _column(table, name).str.replace(",", "", regex=False)
+    return pd.to_numeric(values, errors="coerce").fillna(0).astype(np.int32)
+
+
+# Part of the app's disk-persisted load_data() cache key, which otherwise only
+# hashes load_data's own source. Covers this module and the Dataset layout, so
+# restarts after a parser change don't serve a stale pickle.
+@functools.lru_cache(maxsize=1)
+def parser_fingerprint() -> str:
+    digest = hashlib.sha256()
+    for source in (Path(__file__), Path(__file__).with_name("records.py")):
+        digest.update(source.read_bytes())
+    return digest.hexdigest()
+
+
+def parse_datasets(path: Path) -> list[Dataset]:
+    datasets = []
+    if not path.exists():
+        return datasets
+
+    # pandas pads short rows with "", so the real field count of each row has
+    # to come from a pre-pass. It also tells the C parser the widest row up
+    # front: some rows carry a leading version field or spill past the header.
+    with path.open("r", encoding="utf-8", newline="") as f:
+        reader = csv.reader(f, delimiter="\t")
+        header = next(reader, None)
+        row_lengths = [len(row) for row in reader]
+    while row_lengths and not row_lengths[-1]:
+        row_lengths.pop()
+    if not header or not row_lengths:
+        return datasets
+    num_columns = len(header)
+
+    # Blank lines are kept as empty rows so the frame lines up with row_lengths;
+    # they are dropped below together with rows that have no dataset name.
+    raw = pd.read_csv(
+        path,
+        sep="\t",
+        header=None,
+        skiprows=1,
+        nrows=len(row_lengths),
+        names=range(max(*row_lengths, num_columns)),
+        dtype=str,
+        keep_default_na=False,
+        skip_blank_lines=False,
+        engine="c",
+    )
+    if raw.empty:
+        return datasets
+
+    field_counts = pd.Series(row_lengths, index=raw.index)
+    raw = raw.fillna("")
+
+    first_field = raw[0].str.strip()
+    versioned = field_counts.eq(num_columns + 1) & first_field.str.lower().str.startswith("v")
+    versions = first_field.where(versioned, "")
+    if versioned.any():
+        raw.loc[versioned] = raw.loc[versioned].shift(-1, axis=1).fillna("").to_numpy()
+
+    overflow = field_counts.gt(num_columns) & ~versioned
+    if overflow.any():
+        raw.loc[overflow, num_columns - 1] = raw.loc[overflow, num_columns - 1 :].apply(
+            lambda parts: " ".join(part for part in parts if part.strip()), axis=1
+        )
+
+    table = raw.iloc[:, :num_columns].apply(lambda column: column.str.strip())
+    table.columns = header
+    table = table[_column(table, "Dataset").ne("")]
+    if table.empty:
+        return datasets
+
+    rgb_cams = _to_int_column(table, "# RGB Cams")
+    depth_cams = _to_int_column(table, "# Depth Cams")
+    wrist_cams = _to_int_column(table, "# Wrist Cams")
+    has_rgb = rgb_cams.gt(0)
+    has_depth = depth_cams.gt(0)
+    has_wrist = wrist_cams.gt(0)
+    has_proprioception = _column(table, "Has Proprioception?").str.lower().eq("yes")
+    has_language = ~_column(table, "Language Annotations").str.lower().isin(["", "none", "no"])
+
+    sensors = [
+        tuple(name for name, present in zip(("RGB", "Depth", "Proprioception", "Language"), flags) if present)
+        for flags in zip(has_rgb, has_depth, has_proprioception, has_language)
+    ]
+    viewpoints = [
+        tuple(name for name, present in zip(("Wrist", "External"), flags) if present)
+        for flags in zip(has_wrist, has_rgb | has_depth)
+    ]
+
+    frequency_raw = _column(table, "Control Frequency")
+    frequencies = frequency_raw.where(
+        frequency_raw.str.lower().str.endswith("hz"), frequency_raw + " Hz"
+    ).where(frequency_raw.ne(""), "Unknown")
+
+    registered_names = _column(table, "Registered Dataset Name")
+    dataset_ids = registered_names.where(registered_names.ne(""), table["Dataset"].map(_slugify))
+
+    rows = zip(
+        table.to_dict("records"),
+        dataset_ids,
+        versions.loc[table.index],
+        frequencies,
+        sensors,
+        viewpoints,
+        has_language,
+    )
+    for record, dataset_id, version, frequency, dataset_sensors, dataset_viewpoints, language_labels in rows:
+        datasets.append(
+            Dataset(
+                id=dataset_id,
+                name=record["Dataset"],
+                description=record.get("Description", ""),
+                url=record.get("Dataset URL") or None,
+                robot=record.get("Robot") or "Unknown",
+                end_effector=record.get("Gripper") or "Unknown",
+                morphology=record.get("Robot Morphology", ""),
+                sensors=dataset_sensors,
+                viewpoints=dataset_viewpoints,
+                environment=record.get("Scene Type") or "Unknown",
+                domain=record.get("Data Collect Method", ""),
+                language_labels=bool(language_labels),
+                format=record.get("Action Space") or "Unknown",
+                frequency=frequency,
+                episodes=record.get("# Episodes", ""),
+                file_size_gb=record.get("File Size (GB)", ""),
+                language_annotations=record.get("Language Annotations", ""),
+                data_collect_method=record.get("Data Collect Method", ""),
+                has_suboptimal=record.get("Has Suboptimal?", ""),
+                has_camera_calibration=record.get("Has Camera Calibration?", ""),
+                has_proprioception=record.get("Has Proprioception?", ""),
+                registered_name=record.get("Registered Dataset Name", ""),
+                citation=record.get("Citation", ""),
+                latex_reference=record.get("Latex Reference", ""),
+                version=version or None,
+            )
+        )
+
+    return datasets
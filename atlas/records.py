@@ -0,0 +1,38 @@
+from dataclasses import dataclass
+
+
+# One flat, slotted record per TSV row. It lives outside app.py so the
+# disk-persisted load_data() cache can pickle and unpickle it by import path.
+@dataclass(slots=True)
+class Dataset:
+    id: str
+    name: str
+    description: str
+    url: str | None
+    # Hardware
+    robot: str
+    end_effector: str
+    morphology: str
+    # Modality
+    sensors: tuple[str, ...]
+    viewpoints: tuple[str, ...]
+    # Task and environment
+    environment: str
+    domain: str
+    language_labels: bool
+    # Engineering
+    format: str
+    frequency: str
+    # Stats
+    episodes: str
+    file_size_gb: str
+    language_annotations: str
+    data_collect_method: str
+    has_suboptimal: str
+    has_camera_calibration: str
+    has_proprioception: str
+    # Reference
+    registered_name: str
+    citation: str
+    latex_reference: str
+    version: str | None
@@ -0,0 +1,15 @@
+import sys
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent))
+
+from atlas.images import ROBOT_IMAGE_CACHE_PATH, write_robot_image_cache
+
+
+def main():
+    images = write_robot_image_cache()
+    print(f"Wrote {len(images)} robot images to {ROBOT_IMAGE_CACHE_PATH}")
+
+
+if __name__ == "__main__":
+    main()
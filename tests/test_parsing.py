@@ -0,0 +1,177 @@
+import csv
+import dataclasses
+import re
+from pathlib import Path
+
+import pytest
+
+from atlas.parsing import parse_datasets
+
+DATASET_PATH = Path(__file__).resolve().parent.parent / "data/Open-X-Embodiment-Dataset.tsv"
+
+HEADER = [
+    "Dataset", "Robot", "# Episodes", "File Size (GB)", "Robot Morphology", "Gripper",
+    "Action Space", "# RGB Cams", "# Depth Cams", "# Wrist Cams", "Language Annotations",
+    "Data Collect Method", "Has Suboptimal?", "Has Camera Calibration?", "Has Proprioception?",
+    "Scene Type", "Control Frequency", "Registered Dataset Name", "Citation", "Latex Reference",
+    "Description", "Dataset URL",
+]
+
+
+def _reference_parse(path):
+    # The original csv.reader based parse, flattened to the Dataset fields.
+    def parse_int(value):
+        text = (value or "").strip().replace(",", "")
+        try:
+            return int(float(text)) if text else 0
+        except ValueError:
+            return 0
+
+    datasets = []
+    with path.open("r", encoding="utf-8", newline="") as f:
+        reader = csv.reader(f, delimiter="\t")
+        header = next(reader, None)
+        if not header:
+            return datasets
+        num_columns = len(header)
+
+        for row in reader:
+            if not any(cell.strip() for cell in row):
+                continue
+
+            version = None
+            if len(row) == num_columns + 1 and row[0].strip().lower().startswith("v"):
+                version = row[0].strip()
+                row = row[1:]
+
+            if len(row) > num_columns:
+                overflow = row[num_columns:]
+                row = row[:num_columns]
+                row[-1] = " ".join(part for part in [row[-1], *overflow] if part.strip()).strip()
+            elif len(row) < num_columns:
+                row = row + [""] * (num_columns - len(row))
+
+            record = {key: value.strip() for key, value in zip(header, row)}
+            name = record.get("Dataset", "")
+            if not name:
+                continue
+
+            rgb_cams = parse_int(record.get("# RGB Cams"))
+            depth_cams = parse_int(record.get("# Depth Cams"))
+            wrist_cams = parse_int(record.get("# Wrist Cams"))
+            language = record.get("Language Annotations", "")
+            has_language = language.lower() not in {"", "none", "no"}
+
+            sensors = []
+            if rgb_cams > 0:
+                sensors.append("RGB")
+            if depth_cams > 0:
+                sensors.append("Depth")
+            if record.get("Has Proprioception?", "").lower() == "yes":
+                sensors.append("Proprioception")
+            if has_language:
+                sensors.append("Language")
+            viewpoints = []
+            if wrist_cams > 0:
+                viewpoints.append("Wrist")
+            if rgb_cams > 0 or depth_cams > 0:
+                viewpoints.append("External")
+
+            frequency = record.get("Control Frequency", "")
+            if frequency and not frequency.lower().endswith("hz"):
+                frequency = f"{frequency} Hz"
+            elif not frequency:
+                frequency = "Unknown"
+
+            datasets.append(
+                {
+                    "id": record.get("Registered Dataset Name")
+                    or re.sub(r"[^a-z0-9]+", "-", name.lower()).strip("-")
+                    or "dataset",
+                    "name": name,
+                    "description": record.get("Description", ""),
+                    "url": record.get("Dataset URL") or None,
+                    "robot": record.get("Robot") or "Unknown",
+                    "end_effector": record.get("Gripper") or "Unknown",
+                    "morphology": record.get("Robot Morphology", ""),
+                    "sensors": tuple(sensors),
+                    "viewpoints": tuple(viewpoints),
+                    "environment": record.get("Scene Type") or "Unknown",
+                    "domain": record.get("Data Collect Method", ""),
+                    "language_labels": has_language,
+                    "format": record.get("Action Space") or "Unknown",
+                    "frequency": frequency,
+                    "episodes": record.get("# Episodes", ""),
+                    "file_size_gb": record.get("File Size (GB)", ""),
+                    "language_annotations": language,
+                    "data_collect_method": record.get("Data Collect Method", ""),
+                    "has_suboptimal": record.get("Has Suboptimal?", ""),
+                    "has_camera_calibration": record.get("Has Camera Calibration?", ""),
+                    "has_proprioception": record.get("Has Proprioception?", ""),
+                    "registered_name": record.get("Registered Dataset Name", ""),
+                    "citation": record.get("Citation", ""),
+                    "latex_reference": record.get("Latex Reference", ""),
+                    "version": version,
+                }
+            )
+    return datasets
+
+
+def _row(name, **overrides):
+    values = dict.fromkeys(HEADER, "")
+    values.update(
+        {
+            "Dataset": name,
+            "Robot": "Franka",
+            "# Episodes": "1,000",
+            "Action Space": "EEF Position",
+            "# RGB Cams": "2",
+            "# Wrist Cams": "1",
+            "Scene Type": "Table Top",
+            "Control Frequency": "10",
+            "Registered Dataset Name": name.lower(),
+            "Description": "Robot does things.",
+            "Dataset URL": "https://example.com",
+        }
+    )
+    values.update(overrides)
+    return [values[column] for column in HEADER]
+
+
+def _write_tsv(path, rows):
+    path.write_text("\n".join("\t".join(row) for row in [HEADER, *rows]) + "\n", encoding="utf-8")
+    return path
+
+
+def _assert_matches_reference(path):
+    parsed = [dataclasses.asdict(dataset) for dataset in parse_datasets(path)]
+    assert parsed == _reference_parse(path)
+
+
+def test_matches_reference_on_shipped_tsv():
+    _assert_matches_reference(DATASET_PATH)
+
+
+@pytest.mark.parametrize(
+    "rows",
+    [
+        pytest.param([["v1.0", *_row("Alpha")], _row("Beta")], id="version-prefix"),
+        pytest.param([_row("Viola"), _row("VIMA", Robot="UR5")], id="name-starts-with-v"),
+        pytest.param([_row("Alpha"), [*_row("Beta"), "spilled", "", "text"]], id="overflow"),
+        pytest.param(
+            [["v1.1", *_row("Alpha")], [*_row("Beta"), "spilled"], _row("Viola")],
+            id="version-and-overflow",
+        ),
+        pytest.param([_row("Alpha")[:5], _row("Beta")], id="short-row"),
+        pytest.param([_row("Alpha"), [], ["", "  "], _row("", Robot="UR5"), _row("Beta")], id="blank-rows"),
+        pytest.param([_row("Alpha", **{"Registered Dataset Name": "", "# RGB Cams": "x"})], id="fallbacks"),
+    ],
+)
+def test_matches_reference_on_edge_cases(tmp_path, rows):
+    _assert_matches_reference(_write_tsv(tmp_path / "datasets.tsv", rows))
+
+
+def test_vima_row_is_not_treated_as_versioned():
+    vima = next(d for d in parse_datasets(DATASET_PATH) if d.name == "VIMA")
+    assert vima.robot == "UR5"
+    assert vima.version is None